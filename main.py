@@ -10,32 +10,204 @@
 #     "markitdown[pdf]>=0.1.2",
 #     "requests>=2.32.3",
 #     "pathvalidate>=3.2.0",
+#     "orjson>=3.9.0",
+#     "oauthlib>=3.2.0",
 # ]
 # requires-python = ">=3.10"
 # ///
 
 import os
 import json
+import asyncio
 import requests
 import io
 import datetime
 import argparse
+import base64
+import functools
+import hashlib
+import hmac
 import logging
-from typing import Optional, Dict, Any, List
-from markitdown import MarkItDown
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote
+from typing import Optional, Dict, Any, List, AsyncIterator
+from markitdown import MarkItDown, StreamInfo
 from pathvalidate import sanitize_filename
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
+from oauthlib.common import generate_nonce, generate_timestamp
+from oauthlib.oauth1 import Client, SIGNATURE_HMAC_SHA1
+from oauthlib.oauth1.rfc5849.utils import escape
 from requests_oauthlib import OAuth1Session
 
+# orjson is declared in the script dependencies; fall back to the stdlib when main.py is imported without it.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 # --- Setup Logging ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Characters forbidden in file names on POSIX/Windows, control characters, and those that break Obsidian links.
+_FORBIDDEN_FILENAME_CHARS = str.maketrans(
+    {c: "_" for c in '<>:"/\\|?*#^[]'} | {chr(c): "_" for c in range(0x20)}
+)
+_MAX_TITLE_BYTES = 200
+_SEP = "-" * 50
+
+
+def _write_bytes_atomic(path: Path, data: bytes):
+    """Write data to a sibling temp file and rename it over path, so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _sanitize_title(title: str) -> str:
+    """Make a bookmark title safe to use as (part of) a file name."""
+    if os.name == "nt":
+        # pathvalidate also knows Windows reserved names such as CON and NUL.
+        safe_title = sanitize_filename(title)
+    else:
+        safe_title = title.translate(_FORBIDDEN_FILENAME_CHARS).strip()
+    # Leave room for the date prefix, a duplicate suffix and the extension within the 255-byte limit.
+    safe_title = safe_title.encode("utf-8")[:_MAX_TITLE_BYTES].decode("utf-8", "ignore")
+    return safe_title or "untitled"
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Configuration read from the environment and the .env file.
+    """
+    consumer_key: Optional[str]
+    consumer_secret: Optional[str]
+    save_dir: Optional[str]
+    tag: str
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env once and return the resulting settings."""
+    load_dotenv()
+    return Settings(
+        consumer_key=os.getenv("HATENA_CONSUMER_KEY"),
+        consumer_secret=os.getenv("HATENA_CONSUMER_SECRET"),
+        save_dir=os.getenv("SAVE_DIR"),
+        tag=os.getenv("TARGET_TAG_NAME", "obsidian"),
+    )
+
+
+# Tokens loaded by any clipper in this process, keyed by token file, so later clippers skip the disk.
+_TOKENS_CACHE: Dict[str, Dict[str, str]] = {}
+
+
+def _mount_http_adapter(session: requests.Session, retry: bool = True) -> requests.Session:
+    """
+    Give a session a larger connection pool and, if retry is set, retries on transient gateway errors.
+
+    OAuth-signed sessions must not retry: urllib3 would resend the same nonce, which the server rejects.
+    """
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]) if retry else 0
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Return the process-wide pooled session used for page downloads.
+
+    Customize it (headers, proxies, adapters) before running a clipper.
+    """
+    return _mount_http_adapter(requests.Session())
+
+
+class _FastHMACClient(Client):
+    """
+    oauthlib client that keys HMAC-SHA1 once per secret pair and copies that state for each request.
+    The OAuth parameters that do not change between requests are also built once.
+    """
+    SIGNATURE_METHODS = {
+        **Client.SIGNATURE_METHODS,
+        SIGNATURE_HMAC_SHA1: lambda base_string, client: client._sign_hmac_sha1(base_string),
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._hmac_secrets: Optional[tuple] = None
+        self._hmac_base: Optional[hmac.HMAC] = None
+        self._static_key: Optional[tuple] = None
+        self._static_oauth_params: List[tuple] = []
+        self._rebuild_hmac()
+
+    def _rebuild_hmac(self):
+        """Derive the signing key from the current secrets, as oauthlib's sign_hmac_sha1 does."""
+        secrets = (self.client_secret, self.resource_owner_secret)
+        key = escape(secrets[0] or "") + "&" + escape(secrets[1] or "")
+        # Publish the key before the secrets it belongs to; concurrent signers check the secrets first.
+        self._hmac_base = hmac.new(key.encode("utf-8"), digestmod=hashlib.sha1)
+        self._hmac_secrets = secrets
+
+    def _sign_hmac_sha1(self, base_string: str) -> str:
+        """Sign a signature base string with a copy of the pre-keyed HMAC."""
+        if self._hmac_secrets != (self.client_secret, self.resource_owner_secret):
+            self._rebuild_hmac()
+        signer = self._hmac_base.copy()
+        signer.update(base_string.encode("utf-8"))
+        return base64.b64encode(signer.digest()).decode("utf-8")
+
+    def get_oauth_params(self, request):
+        """Build the OAuth parameters, generating only the nonce and timestamp per request."""
+        if request.body is not None:
+            # Requests with a body may need oauth_body_hash; leave those to oauthlib.
+            return super().get_oauth_params(request)
+        static_key = (self.signature_method, self.client_key, self.resource_owner_key, self.callback_uri, self.verifier)
+        if self._static_key != static_key:
+            static_params = [
+                ("oauth_version", "1.0"),
+                ("oauth_signature_method", self.signature_method),
+                ("oauth_consumer_key", self.client_key),
+            ]
+            if self.resource_owner_key:
+                static_params.append(("oauth_token", self.resource_owner_key))
+            if self.callback_uri:
+                static_params.append(("oauth_callback", self.callback_uri))
+            if self.verifier:
+                static_params.append(("oauth_verifier", self.verifier))
+            # Publish the finished list before its key; concurrent signers check the key first.
+            self._static_oauth_params = static_params
+            self._static_key = static_key
+        return [
+            ("oauth_nonce", generate_nonce() if self.nonce is None else self.nonce),
+            ("oauth_timestamp", generate_timestamp() if self.timestamp is None else self.timestamp),
+            *self._static_oauth_params,
+        ]
+
+
 class HatebuClipper:
     """
     A class to fetch, convert, and manage Hatena Bookmarks.
     """
     # --- Constants ---
     TOKEN_FILE = "tokens.json"
+    CACHE_DIR = ".cache"
+    CACHE_FILE = "cache.json"
+    CACHE_TTL = 3600
     API_URLS = {
         "request_token": "https://www.hatena.com/oauth/initiate",
         "authorization": "https://www.hatena.ne.jp/oauth/authorize",
@@ -43,8 +215,17 @@ class HatebuClipper:
         "search_api": "https://b.hatena.ne.jp/my/search/json",
         "delete_bookmark": "https://bookmark.hatenaapis.com/rest/1/my/bookmark",
     }
-
-    def __init__(self, consumer_key: str, consumer_secret: str, save_dir: Optional[str] = None, dryrun: bool = False, delete_bookmark: bool = True):
+    DELETE_URL_PREFIX = API_URLS["delete_bookmark"] + "?url="
+    MAX_CONCURRENCY = 8
+    DELETE_CONCURRENCY = 4
+    SEARCH_CONCURRENCY = 4
+    CONVERTIBLE_CONTENT_TYPES = (
+        "text/", "application/xhtml+xml", "application/pdf", "application/json",
+        "application/xml", "application/rss+xml", "application/atom+xml",
+    )
+
+    def __init__(self, consumer_key: str, consumer_secret: str, save_dir: Optional[str] = None, dryrun: bool = False, delete_bookmark: bool = True,
+                 concurrency: int = MAX_CONCURRENCY, use_cache: bool = True, cache_ttl: float = CACHE_TTL):
         """
         Initializes the HatebuClipper.
 
@@ -54,17 +235,49 @@ class HatebuClipper:
             save_dir: Directory to save Markdown files.
             dryrun: If True, no files will be written or bookmarks deleted.
             delete_bookmark: If False, bookmarks will not be deleted.
+            concurrency: Maximum number of bookmarks downloaded and converted at once.
+            use_cache: If False, the page cache is neither read nor written.
+            cache_ttl: Seconds during which cached Markdown is reused without contacting the origin.
         """
-        if not all([consumer_key, consumer_secret]):
+        if not (consumer_key and consumer_secret):
             raise ValueError("Consumer key and secret must be provided.")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1.")
 
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
         self.save_dir = save_dir
+        self._save_path = Path(save_dir) if save_dir else None
         self.dryrun = dryrun
         self.delete_bookmark = delete_bookmark
+        self.concurrency = concurrency
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
         self.hatena_session: Optional[OAuth1Session] = None
-        self.md_converter = MarkItDown()
+        self._tokens: Optional[Dict[str, str]] = None
+        self._token_path = Path(self.TOKEN_FILE)
+        self._cache_dir = Path(self.CACHE_DIR)
+        self._yyyymmdd: Optional[str] = None
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cache_dirty = False
+        self._search_urls: Dict[str, str] = {}
+        self.http = get_session()
+
+    @functools.cached_property
+    def md_converter(self) -> MarkItDown:
+        """MarkItDown instance, built on first conversion so auth-only and empty runs skip its setup."""
+        return MarkItDown(enable_plugins=False)
+
+    def __enter__(self) -> "HatebuClipper":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the Hatena API session. The shared page session stays open for other clippers."""
+        if self.hatena_session:
+            self.hatena_session.close()
 
     def _get_access_tokens(self) -> Optional[Dict[str, str]]:
         """Execute OAuth flow to get and save new access tokens."""
@@ -75,17 +288,14 @@ class HatebuClipper:
         try:
             fetch_response = oauth.fetch_request_token(self.API_URLS["request_token"], params=params)
         except Exception as e:
-            logging.error(f"Failed to get request token: {e}")
+            logging.error("Failed to get request token: %s", e)
             return None
 
         resource_owner_key = fetch_response.get("oauth_token")
         resource_owner_secret = fetch_response.get("oauth_token_secret")
 
         authorization_url = oauth.authorization_url(self.API_URLS["authorization"])
-        print("-" * 50)
-        print("Please access the following URL to authenticate:")
-        print(authorization_url)
-        print("-" * 50)
+        sys.stdout.write(f"{_SEP}\nPlease access the following URL to authenticate:\n{authorization_url}\n{_SEP}\n")
         verifier = input("Please enter the PIN code (Verifier): ")
 
         oauth = OAuth1Session(
@@ -97,26 +307,46 @@ class HatebuClipper:
         logging.info("Getting access token...")
         try:
             oauth_tokens = oauth.fetch_access_token(self.API_URLS["access_token"])
-            with open(self.TOKEN_FILE, "w") as f:
-                json.dump(oauth_tokens, f)
-            logging.info(f"Access tokens saved to {self.TOKEN_FILE}.")
+            _write_bytes_atomic(self._token_path, _dumps(oauth_tokens))
+            logging.info("Access tokens saved to %s.", self.TOKEN_FILE)
             return oauth_tokens
         except Exception as e:
-            logging.error(f"Failed to get access token: {e}")
+            logging.error("Failed to get access token: %s", e)
             return None
 
     def _load_or_create_tokens(self) -> Optional[Dict[str, str]]:
-        """Load saved tokens or start the creation flow."""
-        if os.path.exists(self.TOKEN_FILE):
-            logging.info(f"Loading access tokens from {self.TOKEN_FILE}.")
-            with open(self.TOKEN_FILE, "r") as f:
-                return json.load(f)
+        """Return cached tokens, or load saved tokens or start the creation flow."""
+        if self._tokens is not None:
+            return self._tokens
+        if self.TOKEN_FILE in _TOKENS_CACHE:
+            self._tokens = _TOKENS_CACHE[self.TOKEN_FILE]
+            return self._tokens
 
-        logging.warning(f"Could not find {self.TOKEN_FILE}. Starting new authentication flow.")
-        return self._get_access_tokens()
+        try:
+            data = self._token_path.read_bytes()
+        except FileNotFoundError:
+            logging.warning("Could not find %s. Starting new authentication flow.", self.TOKEN_FILE)
+            self._tokens = self._get_access_tokens()
+        else:
+            logging.info("Loading access tokens from %s.", self.TOKEN_FILE)
+            self._tokens = _loads(data)
+        if self._tokens:
+            _TOKENS_CACHE[self.TOKEN_FILE] = self._tokens
+        return self._tokens
+
+    def invalidate_tokens(self):
+        """Drop the cached tokens and session so the next authenticate() reloads them."""
+        self._tokens = None
+        _TOKENS_CACHE.pop(self.TOKEN_FILE, None)
+        if self.hatena_session:
+            self.hatena_session.close()
+            self.hatena_session = None
 
     def authenticate(self) -> bool:
-        """Authenticate and create an OAuth session."""
+        """Authenticate and create an OAuth session, reusing the one from an earlier call."""
+        if self.hatena_session:
+            return True
+
         tokens = self._load_or_create_tokens()
         if not tokens:
             logging.error("Authentication failed. Could not get tokens.")
@@ -125,128 +355,366 @@ class HatebuClipper:
         access_token = tokens.get("oauth_token")
         access_token_secret = tokens.get("oauth_token_secret")
 
-        if not all([access_token, access_token_secret]):
+        if not (access_token and access_token_secret):
             logging.error("Access token or secret is missing in the token file.")
             return False
 
-        self.hatena_session = OAuth1Session(
+        # One session binds one OAuth1 signer and one connection pool for every API call of the run.
+        self.hatena_session = _mount_http_adapter(OAuth1Session(
             client_key=self.consumer_key, client_secret=self.consumer_secret,
-            resource_owner_key=access_token, resource_owner_secret=access_token_secret
-        )
+            resource_owner_key=access_token, resource_owner_secret=access_token_secret,
+            client_class=_FastHMACClient,
+        ), retry=False)
         logging.info("Authentication successful.")
         return True
 
-    def _fetch_bookmark_list(self, tag: str) -> Optional[List[Dict[str, Any]]]:
-        """Fetch a list of bookmarks for a given tag."""
+    def _fetch_bookmark_page(self, tag: str, offset: int = 0) -> Optional[Dict[str, Any]]:
+        """Fetch one page of search results for a given tag, starting at offset."""
         if not self.hatena_session:
             logging.error("Session not authenticated.")
             return None
 
-        params = {"q": tag}
-        logging.info(f"Searching for bookmarks with tag '{tag}'...")
+        search_url = self._search_urls.get(tag)
+        if search_url is None:
+            search_url = self._search_urls[tag] = f"{self.API_URLS['search_api']}?q={quote(tag, safe='')}"
+        if offset:
+            search_url = f"{search_url}&of={offset}"
+        logging.info("Searching for bookmarks with tag '%s' (offset %d)...", tag, offset)
         try:
-            response = self.hatena_session.get(self.API_URLS["search_api"], params=params)
-            response.raise_for_status()
-            data = response.json()
-            bookmarks = data.get("bookmarks", [])
-            if not bookmarks:
-                logging.info("No bookmarks found for the specified tag.")
-                if "error" in data:
-                    logging.error(f"API Error: {data['error']}")
-            return bookmarks
+            # Release the search response as soon as it is parsed; the page downloads that follow are long.
+            with self.hatena_session.get(search_url) as response:
+                if response.status_code == 401:
+                    logging.error("Access token was rejected. Remove %s to authenticate again.", self.TOKEN_FILE)
+                    self.invalidate_tokens()
+                    return None
+                response.raise_for_status()
+                return _loads(response.content)
         except (requests.RequestException, json.JSONDecodeError) as e:
-            logging.error(f"Failed to fetch or parse bookmarks: {e}")
+            logging.error("Failed to fetch or parse bookmarks: %s", e)
+            return None
+
+    async def iter_bookmarks(self, tag: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield bookmarks for a given tag as soon as their result page arrives.
+
+        The first page reveals the total count; the remaining pages are then
+        fetched concurrently, at most SEARCH_CONCURRENCY at a time.
+        """
+        data = await asyncio.to_thread(self._fetch_bookmark_page, tag)
+        if not data:
+            return
+
+        bookmarks = data.get("bookmarks", [])
+        if not bookmarks:
+            logging.info("No bookmarks found for the specified tag.")
+            if "error" in data:
+                logging.error("API Error: %s", data['error'])
+            return
+
+        total = (data.get("meta") or {}).get("total", len(bookmarks))
+        logging.info("--- Found %d bookmarks for tag '%s' ---", total, tag)
+        for bookmark in bookmarks:
+            yield bookmark
+
+        semaphore = asyncio.Semaphore(self.SEARCH_CONCURRENCY)
+
+        async def fetch_page(offset: int) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._fetch_bookmark_page, tag, offset)
+
+        pages = [fetch_page(offset) for offset in range(len(bookmarks), total, len(bookmarks))]
+        for page in asyncio.as_completed(pages):
+            data = await page
+            for bookmark in (data or {}).get("bookmarks", []):
+                yield bookmark
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cache index mapping URL to fetch time, validators and cached Markdown path."""
+        cache_file = self._cache_dir / self.CACHE_FILE
+        try:
+            return _loads(cache_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning("Ignoring unreadable cache %s: %s", cache_file, e)
+            return {}
+
+    def _save_cache(self):
+        """Persist the cache index if it changed during this run."""
+        if not self._cache_dirty or self.dryrun:
+            return
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_bytes_atomic(self._cache_dir / self.CACHE_FILE, _dumps(self._cache))
+        self._cache_dirty = False
+
+    def _cached_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cache entry for a URL if caching is enabled and its Markdown is still on disk."""
+        if not self.use_cache:
             return None
+        if self._cache is None:
+            self._cache = self._load_cache()
+        entry = self._cache.get(url)
+        if entry and Path(entry.get("md_path", "")).is_file():
+            return entry
+        return None
+
+    async def _update_cache(self, url: str, response: requests.Response, content: str):
+        """Remember the converted Markdown, its fetch time and the response validators for later runs."""
+        if self.dryrun or not self.use_cache:
+            return
 
-    def _download_and_convert(self, url: str) -> str:
-        """Download data from a URL and convert it to Markdown."""
+        md_path = self._cache_dir / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".md")
+        await asyncio.to_thread(self._write_cache_markdown, md_path, content)
+        self._cache[url] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "md_path": str(md_path),
+            "fetched_at": time.time(),
+        }
+        self._cache_dirty = True
+
+    def _evict_cache(self, urls: List[str]):
+        """Forget deleted bookmarks and remove their cached Markdown. Blocking; run it off the event loop."""
+        if not self._cache:
+            return
+        for url in urls:
+            entry = self._cache.pop(url, None)
+            if entry is None:
+                continue
+            self._cache_dirty = True
+            try:
+                Path(entry.get("md_path", "")).unlink(missing_ok=True)
+            except OSError as e:
+                logging.warning("Could not remove cached Markdown %s: %s", entry.get("md_path"), e)
+
+    @classmethod
+    def _write_cache_markdown(cls, md_path: Path, content: str):
+        """Write cached Markdown, creating the cache directory if needed."""
+        md_path.parent.mkdir(parents=True, exist_ok=True)
+        cls._write_markdown(md_path, content)
+
+    @staticmethod
+    def _read_markdown(md_path: str) -> str:
+        """Read previously converted Markdown. Blocking; run it off the event loop."""
+        return Path(md_path).read_text(encoding="utf-8")
+
+    def _is_convertible(self, url: str) -> bool:
+        """Probe a URL with HEAD and report whether it is alive and serves something MarkItDown converts."""
+        try:
+            head = self.http.head(url, timeout=5, allow_redirects=True)
+        except requests.RequestException as e:
+            logging.warning("HEAD request failed for %s: %s", url, e)
+            return True  # Let the GET decide.
+
+        if head.status_code in (404, 410):
+            logging.warning("%s is gone (HTTP %d). Skipping.", url, head.status_code)
+            return False
+
+        mimetype = head.headers.get("content-type", "").split(";")[0].strip().lower()
+        if head.ok and mimetype and not mimetype.startswith(self.CONVERTIBLE_CONTENT_TYPES):
+            logging.warning("%s serves %s, which cannot be converted. Skipping.", url, mimetype)
+            return False
+        return True
 
-        logging.info(f"Downloading data from {url}...")
-        response = requests.get(url, timeout=10)
+    async def _download_and_convert(self, url: str) -> str:
+        """Download data from a URL and convert it to Markdown, reusing the cache if fresh or unchanged."""
+        cached = self._cached_entry(url)
+        if cached and time.time() - cached.get("fetched_at", 0) < self.cache_ttl:
+            logging.info("Using cached Markdown for %s.", url)
+            return await asyncio.to_thread(self._read_markdown, cached["md_path"])
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        if not cached and not await asyncio.to_thread(self._is_convertible, url):
+            return ""
+
+        logging.info("Downloading data from %s...", url)
+        response = await asyncio.to_thread(self.http.get, url, timeout=10, headers=headers)
+        if cached and response.status_code == 304:
+            logging.info("Not modified since last run. Using cached Markdown for %s.", url)
+            if not self.dryrun:
+                cached["fetched_at"] = time.time()
+                self._cache_dirty = True
+            return await asyncio.to_thread(self._read_markdown, cached["md_path"])
         response.raise_for_status()
-        data_content = response.text
 
         logging.info("Converting data to Markdown...")
-        data_stream = io.BytesIO(data_content.encode('utf-8'))
+        data_stream = io.BytesIO(response.content)
+        stream_info = self._stream_info(url, response.headers.get("content-type", ""))
         try:
-            result = self.md_converter.convert(data_stream, input_filename="page.data")
+            result = await asyncio.to_thread(self.md_converter.convert, data_stream, stream_info=stream_info)
         except Exception as e:
-            logging.error(f"Failed to convert data to Markdown: {e}")
+            logging.error("Failed to convert data to Markdown: %s", e)
             return ""
 
+        if result.text_content:
+            await self._update_cache(url, response, result.text_content)
         return result.text_content
 
-    def _save_markdown(self, title: str, content: str):
-        """Save Markdown content to a file."""
-        if not self.save_dir:
+    @staticmethod
+    def _stream_info(url: str, content_type: str) -> StreamInfo:
+        """Build MarkItDown hints from the response's Content-Type so it can skip format sniffing."""
+        mimetype, _, params = content_type.partition(";")
+        charset = None
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "charset":
+                charset = value.strip().strip('"') or None
+        return StreamInfo(mimetype=mimetype.strip().lower() or None, charset=charset, url=url)
+
+    async def _save_markdown(self, safe_title: str, content: str):
+        """Save Markdown content to a file named after an already sanitized title."""
+        if not self._save_path:
             logging.warning("Save directory not specified. Skipping save.")
             return
 
-        safe_title = sanitize_filename(title)
-        yyyymmdd = datetime.date.today().strftime('%Y%m%d')
+        yyyymmdd = self._yyyymmdd or datetime.date.today().strftime('%Y%m%d')
         file_name = f"{yyyymmdd}_{safe_title}.md"
-        file_path = os.path.join(self.save_dir, file_name)
+        file_path = self._save_path / file_name
 
-        logging.info(f"Saving Markdown to {file_path}...")
+        logging.info("Saving Markdown to %s...", file_path)
         if self.dryrun:
-            logging.info(f"DRY RUN: Skipping file write to {file_path}.")
+            logging.info("DRY RUN: Skipping file write to %s.", file_path)
             return
 
-        os.makedirs(self.save_dir, exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        await asyncio.to_thread(self._write_markdown, file_path, content)
 
-    def _delete_bookmark(self, url: str):
-        """Delete a bookmark from Hatena."""
+    @staticmethod
+    def _write_markdown(file_path: Path, content: str):
+        """Write Markdown to disk. Blocking; run it off the event loop."""
+        data = memoryview(content.encode("utf-8"))
+        # Raw fd write: one encode pass and no TextIOWrapper buffering or newline translation.
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    async def _delete_bookmark(self, url: str) -> bool:
+        """Delete a bookmark from Hatena and report whether it was deleted."""
         if not self.hatena_session:
             logging.error("Session not authenticated.")
-            return
+            return False
 
-        logging.info(f"Deleting bookmark for {url}...")
+        logging.info("Deleting bookmark for %s...", url)
         if self.dryrun:
-            logging.info(f"DRY RUN: Skipping bookmark deletion for {url}.")
-            return
+            logging.info("DRY RUN: Skipping bookmark deletion for %s.", url)
+            return False
 
-        response = self.hatena_session.delete(self.API_URLS["delete_bookmark"], params={"url": url})
+        response = await asyncio.to_thread(self.hatena_session.delete, self.DELETE_URL_PREFIX + quote(url, safe=""))
         response.raise_for_status()
         logging.info("Bookmark deleted successfully.")
+        return True
 
-    def run(self, tag: str):
-        """
-        Main process to fetch, convert, save, and delete bookmarks.
+    @staticmethod
+    def _unique_safe_title(title: str, used: Counter) -> str:
+        """Sanitize a title for use as a file name, numbering it if an earlier title in used took the name."""
+        base = _sanitize_title(title)
+        safe_title = base
+        while safe_title in used:
+            used[base] += 1
+            safe_title = f"{base} ({used[base]})"
+        used[safe_title] += 1
+        return safe_title
+
+    async def _delete_bookmarks(self, urls: List[str]):
+        """Delete bookmarks concurrently, at most DELETE_CONCURRENCY at a time."""
+        semaphore = asyncio.Semaphore(self.DELETE_CONCURRENCY)
+
+        async def delete(url: str) -> bool:
+            async with semaphore:
+                return await self._delete_bookmark(url)
+
+        results = await asyncio.gather(*(delete(url) for url in urls), return_exceptions=True)
+        deleted = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logging.error("Failed to delete bookmark for %s: %s", url, result)
+            elif result:
+                deleted.append(url)
+        if deleted:
+            await asyncio.to_thread(self._evict_cache, deleted)
+
+    async def _process_bookmark(self, bookmark: Dict[str, Any], safe_title: str, semaphore: asyncio.Semaphore) -> Optional[str]:
         """
-        if not self.authenticate():
-            return
+        Download, convert, and save a single bookmark.
 
-        bookmarks = self._fetch_bookmark_list(tag)
-        if not bookmarks:
-            return
+        Returns:
+            The bookmark URL if its content was produced, i.e. it is safe to delete.
+        """
+        entry = bookmark.get("entry", {})
+        url = entry.get("url")
+        title = entry.get("title", "No Title")
 
-        logging.info(f"--- Found {len(bookmarks)} bookmarks for tag '{tag}' ---")
-        for bookmark in bookmarks:
-            entry = bookmark.get("entry", {})
-            url = entry.get("url")
-            title = entry.get("title", "No Title")
+        if not url:
+            logging.warning("Bookmark with no URL found. Skipping.")
+            return None
 
-            if not url:
-                logging.warning("Bookmark with no URL found. Skipping.")
-                continue
+        async with semaphore:
+            logging.info("\n--- Processing: %s (%s) ---", title, url)
+            try:
+                markdown_content = await self._download_and_convert(url)
 
-            logging.info(f"\n--- Processing: {title} ({url}) ---")
-            markdown_content = self._download_and_convert(url)
+                if not markdown_content:
+                    logging.warning("No content produced for %s. Keeping the bookmark.", url)
+                    return None
 
-            if markdown_content:
                 if not self.save_dir:
-                    print("\n--- Markdown Output ---")
-                    print(markdown_content)
-                    print("--- End of Markdown ---\n")
+                    # One write per page keeps concurrent outputs from interleaving and takes the stdout lock once.
+                    sys.stdout.write(f"\n--- Markdown Output ---\n{markdown_content}\n--- End of Markdown ---\n\n")
                 else:
-                    self._save_markdown(title, markdown_content)
+                    await self._save_markdown(safe_title, markdown_content)
+            except (requests.RequestException, OSError) as e:
+                # One failing page must not abort the run: the others still get saved and deleted.
+                logging.error("Failed to process %s: %s. Keeping the bookmark.", url, e)
+                return None
 
-            if not self.delete_bookmark:
-                continue
+        return url
 
-            self._delete_bookmark(url)
+    async def _process_bookmarks(self, tag: str) -> int:
+        """
+        Process bookmarks concurrently as they are found, at most self.concurrency at a time,
+        then delete the processed ones.
+
+        Returns:
+            The number of bookmarks found.
+        """
+        # Blocking work runs in a pool sized for the page workers plus the concurrent search requests.
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(
+            max_workers=self.concurrency + self.SEARCH_CONCURRENCY, thread_name_prefix="hatebu",
+        ))
+        semaphore = asyncio.Semaphore(self.concurrency)
+        used_titles: Counter = Counter()
+        tasks = []
+        async for bookmark in self.iter_bookmarks(tag):
+            if not tasks and self._save_path and not self.dryrun:
+                self._save_path.mkdir(parents=True, exist_ok=True)
+            safe_title = self._unique_safe_title(bookmark.get("entry", {}).get("title", "No Title"), used_titles)
+            tasks.append(asyncio.create_task(self._process_bookmark(bookmark, safe_title, semaphore)))
+
+        processed = await asyncio.gather(*tasks)
+
+        # Deleting shifts search offsets, so it only starts once every page has been fetched.
+        if self.delete_bookmark:
+            await self._delete_bookmarks([url for url in processed if url])
+        return len(tasks)
+
+    def run(self, tag: str):
+        """
+        Main process to fetch, convert, save, and delete bookmarks.
+        """
+        if not self.authenticate():
+            return
+
+        self._yyyymmdd = datetime.date.today().strftime('%Y%m%d')
+        found = asyncio.run(self._process_bookmarks(tag))
+        self._save_cache()
+        if not found:
+            return
 
         logging.info("--- All bookmarks processed. ---")
 
@@ -255,35 +723,46 @@ def main():
     """
     Parses command-line arguments and runs the clipper.
     """
-    load_dotenv()
+    settings = get_settings()
 
     parser = argparse.ArgumentParser(description="Fetch Hatena Bookmarks and convert to Markdown.")
-    parser.add_argument("--save-dir", type=str, default=os.getenv("SAVE_DIR"),
+    parser.add_argument("--save-dir", type=str, default=settings.save_dir,
                         help="Directory to save Markdown files. Overrides SAVE_DIR env var.")
-    parser.add_argument("--tag", type=str, default=os.getenv("TARGET_TAG_NAME", "obsidian"),
+    parser.add_argument("--tag", type=str, default=settings.tag,
                         help="Tag to search for. Overrides TARGET_TAG_NAME env var.")
     parser.add_argument("--dryrun", action="store_true", help="Dry-run mode. No files written or bookmarks deleted.")
     parser.add_argument("--delete-bookmark", type=lambda x: (str(x).lower() == 'true'), default=True,
                         help="Delete bookmark after processing. (default: True)")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help="Neither read nor write the page cache in .cache/.")
+    parser.add_argument("--cache-ttl", type=float, default=HatebuClipper.CACHE_TTL,
+                        help=f"Seconds during which cached pages are reused without a request. (default: {HatebuClipper.CACHE_TTL})")
+    parser.add_argument("--concurrency", type=int, default=HatebuClipper.MAX_CONCURRENCY,
+                        help=f"Number of bookmarks processed in parallel. (default: {HatebuClipper.MAX_CONCURRENCY})")
     args = parser.parse_args()
-
-    consumer_key = os.getenv("HATENA_CONSUMER_KEY")
-    consumer_secret = os.getenv("HATENA_CONSUMER_SECRET")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1.")
 
     try:
         clipper = HatebuClipper(
-            consumer_key=consumer_key,
-            consumer_secret=consumer_secret,
+            consumer_key=settings.consumer_key,
+            consumer_secret=settings.consumer_secret,
             save_dir=args.save_dir,
             dryrun=args.dryrun,
-            delete_bookmark=args.delete_bookmark
+            delete_bookmark=args.delete_bookmark,
+            concurrency=args.concurrency,
+            use_cache=args.use_cache,
+            cache_ttl=args.cache_ttl
         )
     except ValueError as e:
-        logging.error(f"Initialization failed: {e}")
+        logging.error("Initialization failed: %s", e)
         print("Please set HATENA_CONSUMER_KEY and HATENA_CONSUMER_SECRET in .env file or as environment variables.")
         return
 
-    clipper.run(tag=args.tag)
+    try:
+        clipper.run(tag=args.tag)
+    finally:
+        clipper.close()
 
 if __name__ == "__main__":
     main()
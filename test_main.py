@@ -1,25 +1,28 @@
 import unittest
+import asyncio
 import os
-import json
-import shutil
-from unittest.mock import patch, MagicMock, mock_open
-from main import HatebuClipper, main as main_func
+import time
+import requests
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+from oauthlib.oauth1 import Client
+from pyfakefs import fake_filesystem_unittest
+from main import HatebuClipper, get_settings, main as main_func, _sanitize_title, _TOKENS_CACHE, _FastHMACClient, _write_bytes_atomic
 
-class TestHatebuClipper(unittest.TestCase):
+TOKENS_JSON = '{"oauth_token": "test_token", "oauth_token_secret": "test_secret"}'
+
+class TestHatebuClipper(fake_filesystem_unittest.TestCase):
 
     def setUp(self):
-        """Set up test environment."""
+        """Set up test environment on an in-memory file system."""
+        self.setUpPyfakefs()
         self.consumer_key = "test_consumer_key"
         self.consumer_secret = "test_consumer_secret"
         self.save_dir = "test_save_dir"
-        # Ensure the test save directory is clean before each test
-        if os.path.exists(self.save_dir):
-            shutil.rmtree(self.save_dir)
-
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.save_dir):
-            shutil.rmtree(self.save_dir)
+        # Settings and tokens are cached per process; reload them for each test's environment
+        get_settings.cache_clear()
+        _TOKENS_CACHE.clear()
 
     def test_init_raises_error_on_missing_keys(self):
         """Test that ValueError is raised if consumer keys are missing."""
@@ -28,18 +31,44 @@ class TestHatebuClipper(unittest.TestCase):
         with self.assertRaises(ValueError):
             HatebuClipper(consumer_key=self.consumer_key, consumer_secret=None)
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data='{"oauth_token": "test_token", "oauth_token_secret": "test_secret"}')
-    def test_load_or_create_tokens_existing(self, mock_file, mock_exists):
+    def test_init_raises_error_on_invalid_concurrency(self):
+        """Test that ValueError is raised if concurrency is below one."""
+        with self.assertRaises(ValueError):
+            HatebuClipper(self.consumer_key, self.consumer_secret, concurrency=0)
+
+    def test_load_or_create_tokens_existing(self):
         """Test loading existing tokens."""
+        self.fs.create_file(HatebuClipper.TOKEN_FILE, contents=TOKENS_JSON)
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        tokens = clipper._load_or_create_tokens()
+        self.assertEqual(tokens["oauth_token"], "test_token")
+
+    def test_load_or_create_tokens_cached(self):
+        """Test that tokens are read from disk once until invalidated."""
+        self.fs.create_file(HatebuClipper.TOKEN_FILE, contents=TOKENS_JSON)
         clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        clipper._load_or_create_tokens()
+
+        os.remove(HatebuClipper.TOKEN_FILE)
+        tokens = clipper._load_or_create_tokens()
+        self.assertEqual(tokens["oauth_token"], "test_token")
+
+        self.fs.create_file(HatebuClipper.TOKEN_FILE, contents='{"oauth_token": "new_token", "oauth_token_secret": "new_secret"}')
+        clipper.invalidate_tokens()
         tokens = clipper._load_or_create_tokens()
+        self.assertEqual(tokens["oauth_token"], "new_token")
+
+    def test_load_or_create_tokens_shared_across_clippers(self):
+        """Test that a second clipper in the same process reuses tokens loaded by the first."""
+        self.fs.create_file(HatebuClipper.TOKEN_FILE, contents=TOKENS_JSON)
+        HatebuClipper(self.consumer_key, self.consumer_secret)._load_or_create_tokens()
+
+        os.remove(HatebuClipper.TOKEN_FILE)
+        tokens = HatebuClipper(self.consumer_key, self.consumer_secret)._load_or_create_tokens()
         self.assertEqual(tokens["oauth_token"], "test_token")
-        mock_file.assert_called_with(clipper.TOKEN_FILE, "r")
 
-    @patch("os.path.exists", return_value=False)
     @patch("main.HatebuClipper._get_access_tokens")
-    def test_load_or_create_tokens_not_existing(self, mock_get_access_tokens, mock_exists):
+    def test_load_or_create_tokens_not_existing(self, mock_get_access_tokens):
         """Test creating new tokens when file doesn't exist."""
         mock_get_access_tokens.return_value = {"oauth_token": "new_token"}
         clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
@@ -47,58 +76,347 @@ class TestHatebuClipper(unittest.TestCase):
         self.assertEqual(tokens["oauth_token"], "new_token")
         mock_get_access_tokens.assert_called_once()
 
+    @patch("main.OAuth1Session")
+    @patch("main.HatebuClipper._load_or_create_tokens", return_value={"oauth_token": "t", "oauth_token_secret": "s"})
+    def test_authenticate_reuses_session(self, mock_load_tokens, mock_oauth_session):
+        """Test that repeated authenticate() calls keep the first OAuth session."""
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        self.assertTrue(clipper.authenticate())
+        self.assertTrue(clipper.authenticate())
+
+        mock_oauth_session.assert_called_once()
+        mock_load_tokens.assert_called_once()
+
+    @patch("main.OAuth1Session")
+    @patch("main.HatebuClipper._load_or_create_tokens", return_value={"oauth_token": "t", "oauth_token_secret": "s"})
+    def test_authenticate_mounts_adapter_without_retries(self, mock_load_tokens, mock_oauth_session):
+        """Test that the signed session never resends a request carrying an already used nonce."""
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        clipper.authenticate()
+
+        for call in mock_oauth_session.return_value.mount.call_args_list:
+            self.assertEqual(call.args[1].max_retries.total, 0)
+
+    def test_fast_hmac_client_matches_oauthlib(self):
+        """Test that the pre-keyed HMAC client signs exactly like oauthlib's stock client."""
+        kwargs = dict(client_key="ck", client_secret="c&s", resource_owner_key="tk", resource_owner_secret="t s",
+                      nonce="nonce", timestamp="1700000000")
+        url = "https://bookmark.hatenaapis.com/rest/1/my/bookmark?url=http%3A%2F%2Fexample.com%2F"
+
+        self.assertEqual(_FastHMACClient(**kwargs).sign(url, http_method="DELETE"),
+                         Client(**kwargs).sign(url, http_method="DELETE"))
+
+    def test_fast_hmac_client_rebuilds_static_oauth_params(self):
+        """Test that the cached OAuth parameters follow token and verifier changes."""
+        kwargs = dict(client_key="ck", client_secret="cs", callback_uri="oob", nonce="nonce", timestamp="1700000000")
+        fast_client, stock_client = _FastHMACClient(**kwargs), Client(**kwargs)
+        url = "https://www.hatena.com/oauth/token"
+
+        self.assertEqual(fast_client.sign(url, http_method="POST"), stock_client.sign(url, http_method="POST"))
+        for client in (fast_client, stock_client):
+            client.resource_owner_key = "tk"
+            client.verifier = "verifier"
+        self.assertEqual(fast_client.sign(url, http_method="POST"), stock_client.sign(url, http_method="POST"))
+
     @patch("main.HatebuClipper.authenticate", return_value=True)
-    @patch("main.HatebuClipper._fetch_bookmark_list")
+    @patch("main.HatebuClipper._fetch_bookmark_page")
     @patch("main.HatebuClipper._download_and_convert")
     @patch("main.HatebuClipper._save_markdown")
     @patch("main.HatebuClipper._delete_bookmark")
-    def test_run_success_flow(self, mock_delete, mock_save, mock_convert, mock_fetch_list, mock_auth):
+    def test_run_success_flow(self, mock_delete, mock_save, mock_convert, mock_fetch_page, mock_auth):
         """Test the successful run flow."""
-        mock_fetch_list.return_value = [{"entry": {"url": "http://example.com", "title": "Example Title"}}]
+        mock_fetch_page.return_value = {"bookmarks": [{"entry": {"url": "http://example.com", "title": "Example Title"}}], "meta": {"total": 1}}
         mock_convert.return_value = "# Example Content"
 
         clipper = HatebuClipper(self.consumer_key, self.consumer_secret, save_dir=self.save_dir)
         clipper.run(tag="test_tag")
 
         mock_auth.assert_called_once()
-        mock_fetch_list.assert_called_once_with("test_tag")
+        mock_fetch_page.assert_called_once_with("test_tag")
         mock_convert.assert_called_once_with("http://example.com")
         mock_save.assert_called_once_with("Example Title", "# Example Content")
         mock_delete.assert_called_once_with("http://example.com")
 
     @patch("main.HatebuClipper.authenticate", return_value=True)
-    @patch("main.HatebuClipper._fetch_bookmark_list")
+    @patch("main.HatebuClipper._fetch_bookmark_page")
+    @patch("main.HatebuClipper._download_and_convert")
+    @patch("main.HatebuClipper._save_markdown")
+    @patch("main.HatebuClipper._delete_bookmark")
+    def test_run_keeps_bookmark_without_content(self, mock_delete, mock_save, mock_convert, mock_fetch_page, mock_auth):
+        """Test that only bookmarks whose content was produced are deleted."""
+        mock_fetch_page.return_value = {"bookmarks": [
+            {"entry": {"url": "http://example.com/ok", "title": "OK"}},
+            {"entry": {"url": "http://example.com/empty", "title": "Empty"}},
+        ], "meta": {"total": 2}}
+        mock_convert.side_effect = lambda url: "# OK" if url.endswith("/ok") else ""
+
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret, save_dir=self.save_dir)
+        clipper.run(tag="test_tag")
+
+        mock_save.assert_called_once_with("OK", "# OK")
+        mock_delete.assert_called_once_with("http://example.com/ok")
+
+    @patch("main.HatebuClipper.authenticate", return_value=True)
+    @patch("main.HatebuClipper._fetch_bookmark_page")
+    @patch("main.HatebuClipper._download_and_convert")
+    @patch("main.HatebuClipper._save_markdown")
+    @patch("main.HatebuClipper._delete_bookmark")
+    def test_run_keeps_bookmark_on_download_error(self, mock_delete, mock_save, mock_convert, mock_fetch_page, mock_auth):
+        """Test that a failing download keeps its bookmark without aborting the other ones."""
+        mock_fetch_page.return_value = {"bookmarks": [
+            {"entry": {"url": "http://example.com/ok", "title": "OK"}},
+            {"entry": {"url": "http://example.com/down", "title": "Down"}},
+        ], "meta": {"total": 2}}
+
+        def convert(url):
+            if url.endswith("/down"):
+                raise requests.ConnectionError("connection refused")
+            return "# OK"
+        mock_convert.side_effect = convert
+
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret, save_dir=self.save_dir)
+        clipper.run(tag="test_tag")
+
+        mock_save.assert_called_once_with("OK", "# OK")
+        mock_delete.assert_called_once_with("http://example.com/ok")
+
+    def test_save_markdown_writes_utf8_file(self):
+        """Test that Markdown is written under the run's date prefix."""
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret, save_dir=self.save_dir)
+        clipper._yyyymmdd = "20250101"
+        os.makedirs(self.save_dir)
+
+        asyncio.run(clipper._save_markdown("Title", "# 見出し\n"))
+
+        with open(os.path.join(self.save_dir, "20250101_Title.md"), "rb") as f:
+            self.assertEqual(f.read(), "# 見出し\n".encode("utf-8"))
+
+    def test_write_bytes_atomic_replaces_file(self):
+        """Test that an atomic write replaces the target and leaves no temp file behind."""
+        self.fs.create_file("tokens.json", contents="old")
+
+        _write_bytes_atomic(Path("tokens.json"), TOKENS_JSON.encode("utf-8"))
+
+        with open("tokens.json", "rb") as f:
+            self.assertEqual(f.read(), TOKENS_JSON.encode("utf-8"))
+        self.assertFalse(os.path.exists("tokens.json.tmp"))
+
+    def test_download_and_convert_uses_cache_when_not_modified(self):
+        """Test that a 304 answer to a conditional GET returns the cached Markdown."""
+        os.makedirs(self.save_dir)
+        md_path = os.path.join(self.save_dir, "cached.md")
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write("# Cached")
+
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        clipper._cache = {"http://example.com": {"etag": '"v1"', "last_modified": None, "md_path": md_path, "fetched_at": 0}}
+        clipper.http = MagicMock()
+        clipper.http.get.return_value = MagicMock(status_code=304)
+
+        before = time.time()
+        content = asyncio.run(clipper._download_and_convert("http://example.com"))
+
+        self.assertEqual(content, "# Cached")
+        clipper.http.get.assert_called_once_with("http://example.com", timeout=10, headers={"If-None-Match": '"v1"'})
+        self.assertGreaterEqual(clipper._cache["http://example.com"]["fetched_at"], before)
+        self.assertTrue(clipper._cache_dirty)
+
+    def test_update_cache_records_markdown_and_fetch_time(self):
+        """Test that converted Markdown is cached with its validators and fetch time."""
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        clipper._cache = {}
+        response = MagicMock(headers={"etag": '"v2"', "last-modified": "Wed, 01 Jan 2025 00:00:00 GMT"})
+
+        before = time.time()
+        asyncio.run(clipper._update_cache("http://example.com", response, "# Page"))
+
+        entry = clipper._cache["http://example.com"]
+        self.assertEqual(entry["etag"], '"v2"')
+        self.assertEqual(entry["last_modified"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.assertGreaterEqual(entry["fetched_at"], before)
+        with open(entry["md_path"], encoding="utf-8") as f:
+            self.assertEqual(f.read(), "# Page")
+        self.assertTrue(clipper._cache_dirty)
+
+    def test_download_and_convert_without_cache(self):
+        """Test that use_cache=False neither reads nor writes the cache."""
+        self.fs.create_file(os.path.join(HatebuClipper.CACHE_DIR, "cached.md"), contents="# Cached")
+        self.fs.create_file(os.path.join(HatebuClipper.CACHE_DIR, HatebuClipper.CACHE_FILE), contents=(
+            '{"http://example.com": {"etag": null, "last_modified": null, '
+            f'"md_path": "{HatebuClipper.CACHE_DIR}/cached.md", "fetched_at": {time.time()}}}}}'
+        ))
+
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret, use_cache=False)
+        clipper.http = MagicMock()
+        clipper.http.head.return_value = MagicMock(status_code=200, ok=True, headers={"content-type": "text/html"})
+        clipper.http.get.return_value = MagicMock(status_code=200, content=b"<h1>New</h1>", headers={"content-type": "text/html"})
+        clipper.md_converter = MagicMock()
+        clipper.md_converter.convert.return_value = MagicMock(text_content="# New")
+
+        content = asyncio.run(clipper._download_and_convert("http://example.com"))
+
+        self.assertEqual(content, "# New")
+        clipper.http.get.assert_called_once_with("http://example.com", timeout=10, headers={})
+        self.assertIsNone(clipper._cache)
+        self.assertFalse(clipper._cache_dirty)
+        self.assertEqual(sorted(os.listdir(HatebuClipper.CACHE_DIR)), ["cache.json", "cached.md"])
+
+    def test_download_and_convert_uses_fresh_cache_without_request(self):
+        """Test that Markdown cached within the TTL is returned without any HTTP request."""
+        os.makedirs(self.save_dir)
+        md_path = os.path.join(self.save_dir, "cached.md")
+        with open(md_path, "w", encoding="utf-8") as f:
+            f.write("# Fresh")
+
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret, cache_ttl=60)
+        clipper._cache = {"http://example.com": {"etag": None, "last_modified": None, "md_path": md_path, "fetched_at": time.time()}}
+        clipper.http = MagicMock()
+
+        content = asyncio.run(clipper._download_and_convert("http://example.com"))
+
+        self.assertEqual(content, "# Fresh")
+        clipper.http.head.assert_not_called()
+        clipper.http.get.assert_not_called()
+
+    @patch("main.HatebuClipper._delete_bookmark")
+    def test_delete_bookmarks_evicts_cache(self, mock_delete):
+        """Test that only deleted bookmarks lose their cache entry and cached Markdown."""
+        os.makedirs(HatebuClipper.CACHE_DIR)
+        md_paths = {}
+        for name in ("deleted", "failed"):
+            md_paths[name] = os.path.join(HatebuClipper.CACHE_DIR, f"{name}.md")
+            self.fs.create_file(md_paths[name], contents=f"# {name}")
+
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        clipper._cache = {f"http://example.com/{name}": {"md_path": path} for name, path in md_paths.items()}
+
+        async def delete(url):
+            if url.endswith("/failed"):
+                raise requests.HTTPError("500 Server Error")
+            return True
+        mock_delete.side_effect = delete
+
+        asyncio.run(clipper._delete_bookmarks(["http://example.com/deleted", "http://example.com/failed"]))
+
+        self.assertEqual(list(clipper._cache), ["http://example.com/failed"])
+        self.assertFalse(os.path.exists(md_paths["deleted"]))
+        self.assertTrue(os.path.exists(md_paths["failed"]))
+        self.assertTrue(clipper._cache_dirty)
+
+    def test_download_and_convert_skips_unconvertible_urls(self):
+        """Test that a HEAD probe skips dead URLs and unsupported content types without a GET."""
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        clipper._cache = {}
+        clipper.http = MagicMock()
+
+        clipper.http.head.return_value = MagicMock(status_code=404, ok=False, headers={})
+        self.assertEqual(asyncio.run(clipper._download_and_convert("http://example.com/gone")), "")
+
+        clipper.http.head.return_value = MagicMock(status_code=200, ok=True, headers={"content-type": "video/mp4"})
+        self.assertEqual(asyncio.run(clipper._download_and_convert("http://example.com/video")), "")
+
+        clipper.http.get.assert_not_called()
+
+    def test_stream_info_from_content_type(self):
+        """Test that Content-Type is turned into MarkItDown hints."""
+        info = HatebuClipper._stream_info("http://example.com", 'text/HTML; charset="Shift_JIS"')
+        self.assertEqual(info.mimetype, "text/html")
+        self.assertEqual(info.charset, "Shift_JIS")
+        self.assertEqual(info.url, "http://example.com")
+
+        info = HatebuClipper._stream_info("http://example.com/a.pdf", "")
+        self.assertIsNone(info.mimetype)
+        self.assertIsNone(info.charset)
+
+    def test_api_urls_quote_tag_and_bookmark_url(self):
+        """Test the exact search and delete URLs for values with reserved, space and non-ASCII characters."""
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+        clipper.hatena_session = MagicMock()
+        search_response = clipper.hatena_session.get.return_value.__enter__.return_value
+        search_response.status_code = 200
+        search_response.content = b'{"bookmarks": []}'
+
+        clipper._fetch_bookmark_page("a b&c?日本")
+        clipper._fetch_bookmark_page("a b&c?日本", 20)
+        asyncio.run(clipper._delete_bookmark("http://example.com/a b?x=1&y=日本"))
+
+        self.assertEqual([call.args for call in clipper.hatena_session.get.call_args_list], [
+            ("https://b.hatena.ne.jp/my/search/json?q=a%20b%26c%3F%E6%97%A5%E6%9C%AC",),
+            ("https://b.hatena.ne.jp/my/search/json?q=a%20b%26c%3F%E6%97%A5%E6%9C%AC&of=20",),
+        ])
+        clipper.hatena_session.delete.assert_called_once_with(
+            "https://bookmark.hatenaapis.com/rest/1/my/bookmark?url="
+            "http%3A%2F%2Fexample.com%2Fa%20b%3Fx%3D1%26y%3D%E6%97%A5%E6%9C%AC"
+        )
+
+    @patch("main.HatebuClipper._fetch_bookmark_page")
+    def test_iter_bookmarks_fetches_remaining_pages(self, mock_fetch_page):
+        """Test that pages after the first are fetched by offset up to the reported total."""
+        pages = {
+            0: {"bookmarks": [{"entry": {"url": "u1"}}, {"entry": {"url": "u2"}}], "meta": {"total": 5}},
+            2: {"bookmarks": [{"entry": {"url": "u3"}}, {"entry": {"url": "u4"}}], "meta": {"total": 5}},
+            4: {"bookmarks": [{"entry": {"url": "u5"}}], "meta": {"total": 5}},
+        }
+        mock_fetch_page.side_effect = lambda tag, offset=0: pages[offset]
+        clipper = HatebuClipper(self.consumer_key, self.consumer_secret)
+
+        async def collect():
+            return [bookmark["entry"]["url"] async for bookmark in clipper.iter_bookmarks("test_tag")]
+
+        urls = asyncio.run(collect())
+
+        self.assertEqual(urls[:2], ["u1", "u2"])
+        self.assertCountEqual(urls, ["u1", "u2", "u3", "u4", "u5"])
+        self.assertEqual(mock_fetch_page.call_count, 3)
+
+    def test_unique_safe_title_numbers_duplicates(self):
+        """Test that identical sanitized titles get distinct file names."""
+        used = Counter()
+        safe_titles = [HatebuClipper._unique_safe_title(title, used) for title in ["A/B", "A_B", "A_B", "A_B (2)", "C"]]
+        self.assertEqual(safe_titles, ["A_B", "A_B (2)", "A_B (3)", "A_B (2) (2)", "C"])
+
+    @unittest.skipIf(os.name == "nt", "Windows uses pathvalidate")
+    def test_sanitize_title(self):
+        """Test that forbidden characters are replaced and long titles are cut on a character boundary."""
+        self.assertEqual(_sanitize_title(' a<b>:"c"/d\\e|f?g*\x00h '), "a_b___c__d_e_f_g__h")
+        self.assertEqual(_sanitize_title("[[Note#Head^x]]"), "__Note_Head_x__")
+        self.assertEqual(_sanitize_title("   "), "untitled")
+        self.assertEqual(_sanitize_title("あ" * 100), "あ" * 66)
+
+    @patch("main.HatebuClipper.authenticate", return_value=True)
+    @patch("main.HatebuClipper._fetch_bookmark_page")
     @patch("main.HatebuClipper._download_and_convert")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_run_dryrun_flow(self, mock_open_file, mock_convert, mock_fetch_list, mock_auth):
+    def test_run_dryrun_flow(self, mock_convert, mock_fetch_page, mock_auth):
         """Test that dryrun prevents file writing and bookmark deletion."""
         clipper = HatebuClipper(self.consumer_key, self.consumer_secret, save_dir=self.save_dir, dryrun=True)
         clipper.hatena_session = MagicMock()  # Mock the session to check delete call
 
-        mock_fetch_list.return_value = [{"entry": {"url": "http://example.com", "title": "Example Title"}}]
+        mock_fetch_page.return_value = {"bookmarks": [{"entry": {"url": "http://example.com", "title": "Example Title"}}], "meta": {"total": 1}}
         mock_convert.return_value = "# Example Content"
 
         clipper.run(tag="test_tag")
 
         mock_auth.assert_called_once()
-        mock_fetch_list.assert_called_once_with("test_tag")
+        mock_fetch_page.assert_called_once_with("test_tag")
         mock_convert.assert_called_once_with("http://example.com")
         
         # Assert that file was not written and delete was not called
-        mock_open_file.assert_not_called()
+        self.assertFalse(os.path.exists(self.save_dir))
         clipper.hatena_session.delete.assert_not_called()
 
     @patch('argparse.ArgumentParser.parse_args')
     @patch('main.HatebuClipper')
+    @patch("main.load_dotenv")
     @patch.dict(os.environ, {
         "HATENA_CONSUMER_KEY": "env_key",
         "HATENA_CONSUMER_SECRET": "env_secret",
         "SAVE_DIR": "env/dir",
         "TARGET_TAG_NAME": "env_tag"
     })
-    def test_main_function_with_args(self, mock_clipper_class, mock_args):
+    def test_main_function_with_args(self, mock_load_dotenv, mock_clipper_class, mock_args):
         """Test the main function correctly parses args and calls the clipper."""
-        mock_args.return_value = MagicMock(save_dir="arg/dir", tag="arg_tag", dryrun=True)
+        mock_args.return_value = MagicMock(save_dir="arg/dir", tag="arg_tag", dryrun=True, delete_bookmark=False, concurrency=4,
+                                           use_cache=False, cache_ttl=60.0)
         mock_clipper_instance = MagicMock()
         mock_clipper_class.return_value = mock_clipper_instance
 
@@ -108,15 +426,21 @@ class TestHatebuClipper(unittest.TestCase):
             consumer_key="env_key",
             consumer_secret="env_secret",
             save_dir="arg/dir",  # Arg should override env var
-            dryrun=True
+            dryrun=True,
+            delete_bookmark=False,
+            concurrency=4,
+            use_cache=False,
+            cache_ttl=60.0
         )
         mock_clipper_instance.run.assert_called_once_with(tag="arg_tag")
 
     @patch('argparse.ArgumentParser.parse_args')
+    @patch("main.load_dotenv")
     @patch.dict(os.environ, {"HATENA_CONSUMER_KEY": "", "HATENA_CONSUMER_SECRET": ""}, clear=True)
-    def test_main_function_no_env_vars(self, mock_args):
+    def test_main_function_no_env_vars(self, mock_load_dotenv, mock_args):
         """Test main function exits gracefully if env vars are not set."""
-        mock_args.return_value = MagicMock(save_dir=None, tag="test", dryrun=False)
+        mock_args.return_value = MagicMock(save_dir=None, tag="test", dryrun=False, delete_bookmark=True, concurrency=8,
+                                           use_cache=True, cache_ttl=3600.0)
         
         with patch('main.logging.error') as mock_log_error, \
              patch('builtins.print') as mock_print:
@@ -128,5 +452,16 @@ class TestHatebuClipper(unittest.TestCase):
             mock_print.assert_called_once()
             self.assertIn("Please set HATENA_CONSUMER_KEY", mock_print.call_args[0][0])
 
+    @patch("main.load_dotenv")
+    @patch.dict(os.environ, {"TARGET_TAG_NAME": "env_tag"})
+    def test_get_settings_loads_dotenv_once(self, mock_load_dotenv):
+        """Test that .env is parsed once and settings are served from the cache."""
+        first = get_settings()
+        second = get_settings()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.tag, "env_tag")
+        mock_load_dotenv.assert_called_once()
+
 if __name__ == "__main__":
     unittest.main()